@@ -1,49 +1,199 @@
+import argparse
+import asyncio
+import csv
 import logging
+import os
 from pathlib import Path
-import time
 import random
-import pandas as pd
-import numpy as np
+import re
 
-from playwright.sync_api import sync_playwright, Browser, BrowserContext
+from playwright.async_api import async_playwright, BrowserContext
 
 
-# create CSV if it does not exist
+START_URL = "https://www.amazon.nl/gp/bestsellers/?ref_=nav_cs_bestsellers"
 CSV_FILE = "amazon_products.csv"
 CSV_COLUMNS = [
     "Image", "Title", "Avg Review", "Review Count", "Has Prime",
     "Price", "Delivery", "Availability", "Specifications", "URL"
 ]
-if not Path(CSV_FILE).exists():
-    df = pd.DataFrame(columns=[CSV_COLUMNS])
-    df.to_csv(CSV_FILE, index=False)
+CSV_FLUSH_EVERY = 25  # buffered rows before writing to disk
+# browser profile kept between runs: http cache, cookies and the accepted cookie banner
+PROFILE_DIR = Path(".pw-profile")
+COOKIES_ACCEPTED_FLAG = PROFILE_DIR / ".cookies-accepted"
+
+MAX_CONCURRENT_PRODUCTS = 8  # product pages scraped at the same time, one pooled tab each
+# fresh tab after this many product pages, keeps renderer memory growth bounded
+BROWSER_POOL_RECYCLE_AFTER = int(os.environ.get("BROWSER_POOL_RECYCLE_AFTER", "100"))
+# not needed for scraping, image url is read from the src attribute
+# stylesheets stay loaded: innerText (line breaks, hidden text) depends on CSS
+# blocked by url through CDP, page.route would turn off the http cache for the tab
+BLOCKED_URL_PATTERNS = [
+    # images
+    "*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.avif*", "*.svg*", "*.ico*",
+    # fonts
+    "*.woff*", "*.woff2*", "*.ttf*", "*.otf*",
+    # media
+    "*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*",
+]
+
+# ASIN in a product link, e.g. /dp/B0BHW2975C/ref=...
+ASIN_RE = re.compile(r"/dp/([A-Z0-9]{10})")
+PRODUCT_URL = "https://www.amazon.nl/dp/{asin}"
+
+# CSS selectors per product field, tried in order until one matches
+FIELDS = {
+    "Image": [
+        "#landingImage"
+    ],
+    "Title": [
+        "#productTitle"
+    ],
+    "Avg Review": [
+        "#acrPopover > span > a > span"
+    ],
+    "Review Count": [
+        "#acrCustomerReviewText"
+    ],
+
+    # Multi fallbacks
+    "Has Prime": [
+        "#abb-message"
+    ],
+    "Price": [
+        "#corePriceDisplay_desktop_feature_div > div:nth-of-type(1) > span:nth-of-type(2)",
+        "#corePriceDisplay_desktop_feature_div > div:nth-of-type(1) > span:nth-of-type(3) > span:nth-of-type(2)"
+    ],
+
+    "Delivery": [
+        "#mir-layout-DELIVERY_BLOCK-slot-PRIMARY_DELIVERY_MESSAGE_LARGE > span"
+    ],
+    "Availability": [
+        "#availability"
+    ],
+    "Specifications": [
+        "#productDetails_feature_div"
+    ],
+}
+
+# evaluated in the page: first matching selector per field, Image -> src, others -> text
+SCRAPE_FIELDS_JS = """
+(fields) => {
+    const out = {};
+    for (const [key, selectors] of Object.entries(fields)) {
+        out[key] = null;
+        for (const sel of selectors) {
+            const el = document.querySelector(sel);
+            if (!el) continue;
+            if (key === "Image") {
+                out[key] = el.getAttribute("src");
+                break;
+            }
+            const text = (el.innerText || "").trim();
+            // Price: must start with currency, skip "-22%" or other junk
+            if (key === "Price" && !text.startsWith("€")) continue;
+            out[key] = text;
+            break;  // stop at first match
+        }
+    }
+    return out;
+}
+"""
+
+# evaluated in the page: "text=..." matches clickable elements by text
+# (case-insensitive, like Playwright), anything else is a CSS selector
+ACCEPT_COOKIES_JS = """
+(buttons) => {
+    const visible = (el) => !!(el.offsetParent || el.getClientRects().length);
+    const clickable = [...document.querySelectorAll(
+        "button, a, [role=button], input[type=submit], input[type=button]"
+    )].filter(visible);
+    for (const b of buttons) {
+        let el = null;
+        if (b.startsWith("text=")) {
+            const text = b.slice(5).toLowerCase();
+            el = clickable.find((c) => (c.innerText || c.value || "").toLowerCase().includes(text));
+        } else {
+            el = document.querySelector(b);
+            if (el && !visible(el)) el = null;
+        }
+        if (el) {
+            el.click();
+            return b;
+        }
+    }
+    return null;
+}
+"""
+
+# evaluated in the page: random scrolls down with pauses, small back up sometimes
+HUMAN_SCROLL_JS = """
+async (steps) => {
+    const uniform = (min, max) => min + Math.random() * (max - min);
+    const sleep = (ms) => new Promise((r) => setTimeout(r, ms));
+    for (let i = 0; i < steps; i++) {
+        // small vertical scroll
+        window.scrollBy(0, Math.round(uniform(200, 700)));
+        await sleep(uniform(1000, 2500));
+    }
+    // small back up sometimes
+    if (Math.random() < 0.3) {
+        window.scrollBy(0, -200);
+        await sleep(uniform(1300, 1800));
+    }
+}
+"""
+
+# humanization jitter, no need for a cryptographic RNG here
+_jitter = random.Random()
 
 
 class AmazonScraper:
     """Scrape Amazon without proxy."""
 
-    def __init__(self):
+    def __init__(self, humanize: bool = False):
+        # scroll and wait on product pages like a user, slower but less bot-like
+        self.humanize = humanize
         self.playwright = None
-        self.browser: Browser = None
         self.context: BrowserContext = None
+        self._pool: asyncio.Queue = None
+
+        # keep the CSV open for the whole run, create it with header if it does not exist
+        is_new = not Path(CSV_FILE).exists()
+        self._csv_fh = open(CSV_FILE, "a", newline="", encoding="utf-8")
+        # "\n" line endings, same as the rows pandas wrote before
+        self._csv_writer = csv.DictWriter(self._csv_fh, fieldnames=CSV_COLUMNS, lineterminator="\n")
+        if is_new:
+            self._csv_writer.writeheader()
+        self._row_buf: list[dict] = []
+
         logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
     def get_secure_wait_time(self, min_seconds=1, max_seconds=3):
-        import secrets
-        wait_time = secrets.SystemRandom().uniform(min_seconds, max_seconds)
-        print(f"wait: {wait_time} seconds")
-        return wait_time
-
-    def open_browser(self, headless: bool = False):
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(
+        return _jitter.uniform(min_seconds, max_seconds)
+
+    async def open_browser(self, headless: bool = False):
+        self.playwright = await async_playwright().start()
+        self.context = await self.playwright.chromium.launch_persistent_context(
+            PROFILE_DIR,
             headless=headless,
             channel="chrome"
         )
-        self.context = self.browser.new_context()
+
+        # tabs for product pages, checked out per url and recycled after use
+        self._pool = asyncio.Queue()
+        for _ in range(MAX_CONCURRENT_PRODUCTS):
+            await self._pool.put((await self.new_product_page(), 0))
         return True
 
-    def accept_cookies(self, page):
+    async def new_product_page(self):
+        """New tab that skips images, fonts and media, but keeps the http cache."""
+        page = await self.context.new_page()
+        cdp = await self.context.new_cdp_session(page)
+        await cdp.send("Network.enable")
+        await cdp.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        return page
+
+    async def accept_cookies(self, page):
         buttons = [
             "#sp-cc-accept",                # main Amazon NL accept button
             "text=Accepteer",
@@ -53,64 +203,53 @@ class AmazonScraper:
             "text=Accept",
             "text=Accept all",
             "text=Agree",
-            "button:has-text('Accepteer')",
-            "button:has-text('Accept')",
         ]
 
-        for b in buttons:
-            try:
-                loc = page.locator(b)
-                if loc.is_visible():
-                    loc.click()
-                    logging.info(f"Cookie accepted with: {b}")
-                    break
-            except:
-                pass
+        # check all buttons in-page and click the first visible one, one round-trip
+        try:
+            clicked = await page.evaluate(ACCEPT_COOKIES_JS, buttons)
+            if clicked:
+                logging.info(f"Cookie accepted with: {clicked}")
+                return True
+        except Exception as e:
+            logging.debug(f"Accept cookies failed: {e}")
+        return False
 
-    def search_keyword(self, page, keyword: str):
+    async def search_keyword(self, page, keyword: str):
         box = page.locator("#twotabsearchtextbox")
-        box.wait_for(state="visible", timeout=10000)
-        box.click()
-        box.fill(keyword)
-        page.keyboard.press("Enter")
+        await box.wait_for(state="visible", timeout=10000)
+        await box.click()
+        await box.fill(keyword)
+        await page.keyboard.press("Enter")
 
-    def human_scroll(self, page, steps=3):
+    async def human_scroll(self, page, steps=3):
         """Do small random scrolls to simulate user activity."""
-        for _ in range(steps):
-            # small vertical scroll
-            distance = random.randint(200, 700)
-            page.evaluate(f"window.scrollBy(0, {distance})")
-            time.sleep(self.get_secure_wait_time(1, 2.5))
-        # small back up sometimes
-        if random.random() < 0.3:
-            page.evaluate("window.scrollBy(0, -200)")
-            time.sleep(self.get_secure_wait_time(1.3, 1.8))
-
-    def get_all_product_links(self, page, limit: int | None = None, max_scrolls: int = 10):
+        # whole scroll and wait sequence runs in-page, one round-trip
+        await page.evaluate(HUMAN_SCROLL_JS, steps)
+
+    async def get_all_product_links(self, page, limit: int | None = None, max_scrolls: int = 10):
         """
         Scroll a bit and collect unique product links with /dp/.
+        Links are deduplicated by ASIN and returned as canonical product urls.
         If limit provided, return up to limit links.
         """
         seen = set()
         prev_count = 0
 
         for scroll_round in range(max_scrolls):
-            # collect current links
-            links = page.locator("a.a-link-normal[href*='/dp/']")
-            count = links.count()
-            for i in range(count):
-                href = links.nth(i).get_attribute("href")
-                if not href:
-                    continue
-                if "/dp/" in href:
-                    # normalize to absolute url
-                    if href.startswith("http"):
-                        full = href
-                    else:
-                        full = "https://www.amazon.nl" + href.split("?")[0]
-                    seen.add(full)
-
-            # if we've reached limit, break
+            # collect current links, all hrefs in one round-trip
+            hrefs = await page.locator("a.a-link-normal[href*='/dp/']").evaluate_all(
+                "els => els.map(e => e.getAttribute('href'))"
+            )
+            for href in hrefs:
+                m = ASIN_RE.search(href or "")
+                if m:
+                    seen.add(m.group(1))
+                    # stop as soon as we have enough links
+                    if limit and len(seen) >= limit:
+                        break
+
+            # if we've reached limit, no more scrolling
             if limit and len(seen) >= limit:
                 break
 
@@ -120,30 +259,28 @@ class AmazonScraper:
             prev_count = len(seen)
 
             # scroll a bit to load more items and act human
-            self.human_scroll(page, steps=random.randint(2, 7))
-            time.sleep(self.get_secure_wait_time(1.7, 2.8))
+            await self.human_scroll(page, steps=random.randint(2, 7))
+            await asyncio.sleep(self.get_secure_wait_time(1.7, 2.8))
 
-        urls = list(seen)
-        if limit:
-            return urls[:limit]
-        return urls
+        # never more than limit, collection stops once it is reached
+        return [PRODUCT_URL.format(asin=asin) for asin in seen]
     
-    def go_to_next_search_page(self, page):
+    async def go_to_next_search_page(self, page):
         """
         Try to click the pagination 'next' button. Return True if navigated.
         """
         try:
             # common next button
             next_btn = page.locator("a.s-pagination-next, a.s-pagination-item.s-pagination-next")
-            if next_btn.count() and next_btn.first.is_visible():
-                next_btn.first.click()
+            if await next_btn.count() and await next_btn.first.is_visible():
+                await next_btn.first.click()
                 logging.info("Clicked pagination next button")
                 return True
 
             # fallback: find link with text 'Volgende' or 'Next'
             fallback = page.locator("a:has-text('Volgende'), a:has-text('Next')")
-            if fallback.count() and fallback.first.is_visible():
-                fallback.first.click()
+            if await fallback.count() and await fallback.first.is_visible():
+                await fallback.first.click()
                 logging.info("Clicked fallback next link")
                 return True
 
@@ -151,162 +288,193 @@ class AmazonScraper:
             logging.debug(f"Next page click failed: {e}")
         return False
     
-    def open_product_page(self, page, url: str):
-        page.goto(url)
-        # act like a user: small scroll and wait
-        self.human_scroll(page, steps=random.randint(2, 4))
-        time.sleep(self.get_secure_wait_time(2, 5))
+    async def open_product_page(self, page, url: str):
+        # scraped fields are in the initial html, no need to wait for subresources
+        await page.goto(url, wait_until="domcontentloaded", timeout=15000)
+        try:
+            await page.wait_for_selector("#productTitle", timeout=5000)
+        except Exception as e:
+            logging.debug(f"Product title not found on {url}: {e}")
+
+        if self.humanize:
+            # act like a user: small scroll and wait
+            await self.human_scroll(page, steps=random.randint(2, 4))
+            await asyncio.sleep(self.get_secure_wait_time(2, 5))
 
-    def scrape_product_data(self, page, url):
+    async def scrape_product_data(self, page, url):
         """Scrape the product data and append to CSV."""
-        self.human_scroll(page, steps=random.randint(2, 4))
-        time.sleep(self.get_secure_wait_time(2.5, 5.5))
+        if self.humanize:
+            await self.human_scroll(page, steps=random.randint(2, 4))
+            await asyncio.sleep(self.get_secure_wait_time(2.5, 5.5))
 
-        data = {col: np.nan for col in CSV_COLUMNS}
+        # None is written as an empty cell
+        data = dict.fromkeys(CSV_COLUMNS)
         data["URL"] = url
 
-        fields = {
-            "Image": [
-                '//*[@id="landingImage"]'
-            ],
-            "Title": [
-                '//*[@id="productTitle"]'
-            ],
-            "Avg Review": [
-                '//*[@id="acrPopover"]/span/a/span'
-            ],
-            "Review Count": [
-                '//*[@id="acrCustomerReviewText"]'
-            ],
-            
-            # Multi fallbacks
-            "Has Prime": [
-                '//*[@id="abb-message"]'
-            ],
-            "Price": [
-                '//*[@id="corePriceDisplay_desktop_feature_div"]/div[1]/span[2]',
-                '//*[@id="corePriceDisplay_desktop_feature_div"]/div[1]/span[3]/span[2]'
-            ],
-
-            "Delivery": [
-                '//*[@id="mir-layout-DELIVERY_BLOCK-slot-PRIMARY_DELIVERY_MESSAGE_LARGE"]/span'
-            ],
-            "Availability": [
-                '//*[@id="availability"]'
-            ],
-            "Specifications": [
-                '//*[@id="productDetails_feature_div"]'
-            ],
-        }
+        # resolve all fields in-page, one round-trip instead of one per selector
+        try:
+            values = await page.evaluate(SCRAPE_FIELDS_JS, FIELDS)
+        except Exception as e:
+            logging.debug(f"Field evaluation failed: {e}")
+            values = {}
+
+        for key in FIELDS:
+            data[key] = values.get(key)
+
+        # buffer row, written to CSV in batches
+        self._row_buf.append(data)
+        if len(self._row_buf) >= CSV_FLUSH_EVERY:
+            self.flush_rows()
+        logging.info(f"Product data buffered: {data.get('Title', 'Unknown')}")
+
+    async def scrape_product(self, url: str):
+        """Visit and scrape one product page in a tab from the pool."""
+        page, uses = await self._pool.get()
+        failed = False
+        try:
+            logging.info(f"Visiting: {url}")
+            await self.open_product_page(page, url)
+            if self.humanize:
+                await asyncio.sleep(self.get_secure_wait_time(2, 5))
 
-        for key, xpaths in fields.items():
-            try:
-                # Normalize to list
-                xpaths = xpaths if isinstance(xpaths, list) else [xpaths]
-
-                val = np.nan
-                for xp in xpaths:
-                    elem = page.locator(f'xpath={xp}')
-                    if elem.count() > 0:
-                        # Price: must start with currency
-                        if key == "Price":
-                            text = elem.first.inner_text().strip()
-                            if not text.startswith("€"):
-                                continue  # skip "-22%" or other junk
-                        if key == "Image":
-                            val = elem.first.get_attribute("src")
-                        else:
-                            val = elem.first.inner_text().strip()
-                        break  # stop at first match
-
-                data[key] = val
-            except:
-                data[key] = np.nan
-
-        # append row to CSV
-        df_row = pd.DataFrame([data])
-        df_row.to_csv(CSV_FILE, mode='a', header=False, index=False)
-        logging.info(f"Product data saved: {data.get('Title', 'Unknown')}")
-
-    def close_browser(self):
-        if self.context:
-            logging.info("Closing browser context")
-            self.context.close()
+            logging.info("Scrape data")
+            await self.scrape_product_data(page, url)
+        except Exception as e:
+            logging.error(f"Failed to scrape {url}: {e}")
+            failed = True
+        finally:
+            uses += 1
+            # replace worn out or possibly broken tabs (e.g. crashed renderer)
+            if failed or page.is_closed() or uses >= BROWSER_POOL_RECYCLE_AFTER:
+                page, uses = await self.replace_product_page(page), 0
+            # always hand the slot back, otherwise the pool drains and gather hangs
+            self._pool.put_nowait((page, uses))
+
+    async def replace_product_page(self, page):
+        """Close a pooled tab and open a new one, keep the old one if that fails."""
+        logging.info("Recycling product tab")
+        try:
+            if not page.is_closed():
+                await page.close()
+            return await self.new_product_page()
+        except Exception as e:
+            logging.error(f"Failed to recycle product tab: {e}")
+            return page
+
+    async def scrape_products(self, urls):
+        """Scrape product pages concurrently, at most one per pooled tab."""
+        await asyncio.gather(*(self.scrape_product(url) for url in urls))
+
+    async def scrape_keyword(self, keyword: str, max_pages: int = 5):
+        """Search a keyword in its own tab, collect product links and scrape them."""
+        collected = set()
+        page = await self.context.new_page()
+        try:
+            await page.goto(START_URL)
+            await asyncio.sleep(self.get_secure_wait_time(2, 5))
+
+            logging.info(f"Searched keyword: {keyword}")
+            await self.search_keyword(page, keyword)
+            await asyncio.sleep(self.get_secure_wait_time(3, 7))
+
+            for pnum in range(max_pages):
+                logging.info(f"[{keyword}] Collecting links on page {pnum+1}")
+                found = await self.get_all_product_links(page, limit=None, max_scrolls=6)
+                collected.update(found)
+
+                # try to go to next page
+                moved = await self.go_to_next_search_page(page)
+                if not moved:
+                    logging.info(f"[{keyword}] No next page found, stopping pagination")
+                    break
+                # wait after navigation
+                await asyncio.sleep(self.get_secure_wait_time(3, 7))
+        except Exception as e:
+            # stop paginating, links collected so far are still scraped
+            logging.error(f"Error while searching {keyword}: {e}")
+        finally:
+            await page.close()
+
+        logging.info(f"[{keyword}] Found {len(collected)} unique product urls across pages")
+
+        # visit product pages concurrently, shares the tab pool with other keywords
+        await self.scrape_products(list(collected))
+
+    def flush_rows(self):
+        """Write buffered product rows to CSV."""
+        if not self._row_buf:
+            return
+        self._csv_writer.writerows(self._row_buf)
+        self._csv_fh.flush()
+        logging.info(f"Wrote {len(self._row_buf)} rows to {CSV_FILE}")
+        self._row_buf.clear()
+
+    async def close_browser(self):
+        if not self._csv_fh.closed:
+            self.flush_rows()
+            self._csv_fh.close()
+
+        if self._pool:
+            logging.info("Closing pooled product tabs")
+            while not self._pool.empty():
+                page, _ = self._pool.get_nowait()
+                await page.close()
 
-        if self.browser:
+        if self.context:
             logging.info("Closing browser")
-            self.browser.close()
+            await self.context.close()
 
         if self.playwright:
-            self.playwright.stop()
+            await self.playwright.stop()
 
         logging.info("Browser closed successfully")
 
 
-if __name__ == "__main__":
-    scraper = AmazonScraper()
+async def main(humanize: bool = False):
+    scraper = AmazonScraper(humanize=humanize)
 
     try:
-        if scraper.open_browser(headless=False):
-            page = scraper.context.new_page()
-
-            # Visit URL
-            logging.info("Navigated to Amazon")
-            page.goto("https://www.amazon.nl/gp/bestsellers/?ref_=nav_cs_bestsellers")
-            time.sleep(scraper.get_secure_wait_time(2, 5))
+        if await scraper.open_browser(headless=False):
+            # tab opened by the persistent context itself, before the pooled tabs
+            page = scraper.context.pages[0]
 
-            # Accept Coockies
-            logging.info("Accept Cookies")
-            scraper.accept_cookies(page)
-            time.sleep(scraper.get_secure_wait_time(2, 5))
-
-            # Click on Searchbar and Search keywords 
-            keywords = ['cup', 'skincare', 'charger']
-            for kw in keywords:
-                logging.info(f"Searched keyword: {kw}")
-                scraper.search_keyword(page, kw)
-                time.sleep(scraper.get_secure_wait_time(3, 7))
-
-                # traverse pages and collect links up to max_pages
-                max_pages = 5
-                collected = set()
-                for pnum in range(max_pages):
-                    logging.info(f"Collecting links on page {pnum+1}")
-                    found = scraper.get_all_product_links(page, limit=None, max_scrolls=6)
-                    for u in found:
-                        collected.add(u)
-
-                    # try to go to next page
-                    moved = scraper.go_to_next_search_page(page)
-                    if not moved:
-                        logging.info("No next page found, stopping pagination")
-                        break
-                    # wait after navigation
-                    time.sleep(scraper.get_secure_wait_time(3, 7))
+            # Accept Coockies, remembered in the browser profile after the first run
+            if not COOKIES_ACCEPTED_FLAG.exists():
+                # Visit URL
+                logging.info("Navigated to Amazon")
+                await page.goto(START_URL)
+                await asyncio.sleep(scraper.get_secure_wait_time(2, 5))
 
-                product_urls = list(collected)
-                logging.info(f"Found {len(product_urls)} unique product urls across pages")
+                logging.info("Accept Cookies")
+                if await scraper.accept_cookies(page):
+                    COOKIES_ACCEPTED_FLAG.touch()
+                await asyncio.sleep(scraper.get_secure_wait_time(2, 5))
 
-                # visit each product page
-                for url in product_urls:
-                    logging.info(f"Visiting: {url}")
-                    scraper.open_product_page(page, url)
-                    time.sleep(scraper.get_secure_wait_time(2, 5))
+            await page.close()
 
-                    logging.info("Scrape data")
-                    scraper.scrape_product_data(page, url)
-                    time.sleep(scraper.get_secure_wait_time(2, 5))
-
-                # clear for next keyword
-                product_urls = []
-                collected.clear()
+            # Click on Searchbar and Search keywords, all keywords at once, one search tab each
+            keywords = ['cup', 'skincare', 'charger']
 
+            # traverse pages and collect links up to max_pages
+            max_pages = 5
+            await asyncio.gather(*(scraper.scrape_keyword(kw, max_pages) for kw in keywords))
 
             logging.info("==================== SCRAPER COMPLETED! ====================")
-            time.sleep(scraper.get_secure_wait_time(3, 7))
+            await asyncio.sleep(scraper.get_secure_wait_time(3, 7))
 
     except Exception as e:
         logging.error(f"Error during scraping: {e}")
 
     finally:
-        scraper.close_browser()
+        await scraper.close_browser()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape Amazon product data to CSV.")
+    parser.add_argument(
+        "--humanize", action="store_true",
+        help="scroll and wait on product pages like a user (slower, less bot-like)"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(main(humanize=args.humanize))